@@ -35,6 +35,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a ConfigEntry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id)
+
+    return unload_ok
+
+
 # async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 #     """Set up the custom component from yaml configuration."""
 #     hass.data.setdefault(DOMAIN, {})
@@ -0,0 +1,240 @@
+"""Import buffered gateway readings as long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.components.sensor import (
+    UNIT_CONVERTERS,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import BACKLOG_MAX_AGE
+
+_LOGGER = logging.getLogger(__name__)
+
+# A total dropping by more than 10% is a meter reset, the same rule the
+# recorder applies when compiling statistics from states. Smaller drops are
+# ignored.
+RESET_THRESHOLD = 0.9
+
+HOUR = timedelta(hours=1)
+
+# Lock and number of pending imports per statistic_id.
+_LOCKS: dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+async def async_import_backlog_statistics(
+    hass: HomeAssistant,
+    sensor: SensorEntity,
+    readings: list[tuple[datetime, float]],
+) -> None:
+    """Import timestamped readings of the sensor as hourly statistics."""
+
+    state_class = sensor.entity_description.state_class
+    if state_class not in (
+        SensorStateClass.MEASUREMENT,
+        SensorStateClass.TOTAL_INCREASING,
+    ):
+        return
+
+    statistic_id = sensor.entity_id
+    convert = get_unit_converter(sensor)
+    if convert is None:
+        _LOGGER.debug(
+            "Cannot convert %(native_unit)s to %(unit)s, skipping backlog of %(id)s",
+            {
+                "native_unit": sensor.native_unit_of_measurement,
+                "unit": sensor.unit_of_measurement,
+                "id": statistic_id,
+            },
+        )
+        return
+
+    # The current hour is compiled by the recorder from the entity state.
+    current_hour = get_hour_start(dt_util.utcnow())
+    readings = sorted(
+        (timestamp, convert(value))
+        for timestamp, value in readings
+        if timestamp < current_hour
+    )
+    if not readings:
+        return
+
+    metadata = StatisticMetaData(
+        has_mean=state_class == SensorStateClass.MEASUREMENT,
+        has_sum=state_class == SensorStateClass.TOTAL_INCREASING,
+        name=sensor.name,
+        source=RECORDER_DOMAIN,
+        statistic_id=statistic_id,
+        unit_of_measurement=sensor.unit_of_measurement,
+    )
+
+    # The next batch of the same statistic has to continue from this one.
+    lock, users = _LOCKS.get(statistic_id, (asyncio.Lock(), 0))
+    _LOCKS[statistic_id] = (lock, users + 1)
+    try:
+        async with lock:
+            if state_class == SensorStateClass.TOTAL_INCREASING:
+                last = await get_instance(hass).async_add_executor_job(
+                    get_last_statistic,
+                    hass,
+                    statistic_id,
+                    get_hour_start(readings[0][0]),
+                )
+                statistics = compose_total_statistics(readings, last, current_hour)
+            else:
+                statistics = compose_measurement_statistics(readings, current_hour)
+
+            if not statistics:
+                return
+
+            _LOGGER.debug(
+                "Importing %(count)s hourly statistics for %(statistic_id)s",
+                {"count": len(statistics), "statistic_id": statistic_id},
+            )
+            async_import_statistics(hass, metadata, statistics)
+            await get_instance(hass).async_block_till_done()
+    finally:
+        lock, users = _LOCKS[statistic_id]
+        if users > 1:
+            _LOCKS[statistic_id] = (lock, users - 1)
+        else:
+            del _LOCKS[statistic_id]
+
+
+def get_hour_start(moment: datetime) -> datetime:
+    """Return the start of the hour the moment falls into."""
+
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def get_unit_converter(sensor: SensorEntity) -> Callable[[float], float] | None:
+    """Return a converter from the native unit to the sensor state unit."""
+
+    native_unit = sensor.native_unit_of_measurement
+    unit = sensor.unit_of_measurement
+    if native_unit == unit:
+        return lambda value: value
+
+    converter = UNIT_CONVERTERS.get(sensor.device_class)
+    if (
+        converter is None
+        or native_unit not in converter.VALID_UNITS
+        or unit not in converter.VALID_UNITS
+    ):
+        return None
+
+    return converter.converter_factory(native_unit, unit)
+
+
+def compose_total_statistics(
+    readings: list[tuple[datetime, float]],
+    last: dict[str, Any] | None,
+    end: datetime,
+) -> list[StatisticData]:
+    """Compose hourly state/sum statistics continuing the last known sum.
+
+    A row is composed for every hour from the first reading up to the end, the
+    recorder already compiled rows with the stale state for the outage hours.
+    """
+
+    if last is not None and last.get("state") is not None:
+        last_state, last_sum = last["state"], last.get("sum") or 0.0
+    else:
+        last_state, last_sum = readings[0][1], 0.0
+
+    statistics: list[StatisticData] = []
+    start = get_hour_start(readings[0][0])
+    position = 0
+    while start < end:
+        while position < len(readings) and readings[position][0] < start + HOUR:
+            value = readings[position][1]
+            position += 1
+            if value < RESET_THRESHOLD * last_state:
+                last_sum += value
+                last_state = value
+            elif value > last_state:
+                last_sum += value - last_state
+                last_state = value
+
+        statistics.append(StatisticData(start=start, state=last_state, sum=last_sum))
+        start += HOUR
+
+    return statistics
+
+
+def compose_measurement_statistics(
+    readings: list[tuple[datetime, float]], end: datetime
+) -> list[StatisticData]:
+    """Compose hourly mean/min/max statistics from the readings.
+
+    Only hours covered by the readings completely are composed, the recorder
+    compiled the edge hours from live states as well. Like the recorder, the
+    mean is weighted by the time each value was held.
+    """
+
+    statistics: list[StatisticData] = []
+    start = get_hour_start(readings[0][0])
+    if start < readings[0][0]:
+        start += HOUR
+
+    # The reading in effect at the start of the hour.
+    position = 0
+    while start + HOUR <= min(readings[-1][0], end):
+        while position + 1 < len(readings) and readings[position + 1][0] <= start:
+            position += 1
+
+        moment, value = start, readings[position][1]
+        total, values = 0.0, [value]
+        for timestamp, next_value in readings[position + 1 :]:
+            if timestamp >= start + HOUR:
+                break
+            total += value * (timestamp - moment).total_seconds()
+            moment, value = timestamp, next_value
+            values.append(value)
+        total += value * (start + HOUR - moment).total_seconds()
+
+        statistics.append(
+            StatisticData(
+                start=start,
+                mean=total / HOUR.total_seconds(),
+                min=min(values),
+                max=max(values),
+            )
+        )
+        start += HOUR
+
+    return statistics
+
+
+def get_last_statistic(
+    hass: HomeAssistant, statistic_id: str, before: datetime
+) -> dict[str, Any] | None:
+    """Return the last hourly statistic recorded before the given time."""
+
+    rows = statistics_during_period(
+        hass,
+        before - BACKLOG_MAX_AGE,
+        before,
+        {statistic_id},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    if not rows.get(statistic_id):
+        return None
+
+    return rows[statistic_id][-1]
@@ -1,6 +1,7 @@
 """Support for RFM Gateway binary sensors."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
 from homeassistant.components import mqtt
@@ -14,10 +15,10 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.util import slugify
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import CONF_GATEWAYS, DOMAIN, NODE_TOPIC
-from .data_parser import get_binary_sensor_value
+from .const import BACKLOG_TOPIC, CONF_GATEWAYS, DOMAIN, NODE_TOPIC
+from .data_parser import get_binary_sensor_value, parse_backlog
 from .device import compose_gateway_device, compose_node_device
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ class NodeBinarySensor(BinarySensorEntity):
     TYPE = DOMAIN
     entity_description: NodeBinarySensorEntityDescription
     node_type = 0
+    updated_at: datetime | None = None
     _attr_should_poll = False
     _attr_has_entity_name = True
 
@@ -90,6 +92,34 @@ async def async_setup_entry(
             config["mac"].lower(), config["name"]
         )
 
+    @callback
+    def async_process_sensor(
+        sensor: NodeBinarySensor, data: bytes, timestamp: datetime
+    ) -> None:
+        unique_id = sensor.unique_id.replace(":", "_")
+        if unique_id not in store:
+            sensor.hass = hass
+            sensor.updated_at = timestamp
+            sensor.async_update_value(data)
+            store[unique_id] = sensor
+            _LOGGER.debug(
+                "Registering binary sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+            async_add_entities((sensor,), True)
+        elif timestamp <= store[unique_id].updated_at:
+            _LOGGER.debug(
+                "Skipping outdated value of binary sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+        else:
+            _LOGGER.debug(
+                "Updating binary sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+            store[unique_id].updated_at = timestamp
+            store[unique_id].async_update_value(data)
+
     @callback
     def async_sensor_event_received(msg):
         gateway_id = msg.topic.split("/")[1].replace("_", ":").lower()
@@ -105,25 +135,39 @@ async def async_setup_entry(
 
         sensors = compose_node_entities(gateway_id, data)
         for sensor in sensors:
-            unique_id = sensor.unique_id.replace(":", "_")
-            if unique_id not in store:
-                sensor.hass = hass
-                sensor.async_update_value(data)
-                store[unique_id] = sensor
-                _LOGGER.debug(
-                    "Registering binary sensor %(name)s => %(unique_id)s",
-                    {"name": sensor.name, "unique_id": sensor.unique_id},
-                )
-                async_add_entities((sensor,), True)
-            else:
-                _LOGGER.debug(
-                    "Updating binary sensor %(name)s => %(unique_id)s",
-                    {"name": sensor.name, "unique_id": sensor.unique_id},
-                )
-                store[unique_id].async_update_value(data)
-
-    await mqtt.async_subscribe(
-        hass, NODE_TOPIC, async_sensor_event_received, qos=0, encoding=None
+            async_process_sensor(sensor, data, dt_util.utcnow())
+
+    @callback
+    def async_backlog_received(msg):
+        gateway_id = msg.topic.split("/")[1].replace("_", ":").lower()
+        gateway = gateways.get(gateway_id)
+
+        if not gateway:
+            _LOGGER.debug(
+                "No gateway with MAC %(gateway_id)s",
+                {"gateway_id": gateway_id},
+            )
+            return
+
+        # Binary sensors have no statistics, only the newest frame matters.
+        latest: dict[str, tuple[NodeBinarySensor, bytes, datetime]] = {}
+        for timestamp, data in parse_backlog(bytes(msg.payload)):
+            for sensor in compose_node_entities(gateway_id, data):
+                latest[sensor.unique_id] = (sensor, data, timestamp)
+
+        for sensor, data, timestamp in latest.values():
+            async_process_sensor(sensor, data, timestamp)
+
+    entry.async_on_unload(store.clear)
+    entry.async_on_unload(
+        await mqtt.async_subscribe(
+            hass, NODE_TOPIC, async_sensor_event_received, qos=0, encoding=None
+        )
+    )
+    entry.async_on_unload(
+        await mqtt.async_subscribe(
+            hass, BACKLOG_TOPIC, async_backlog_received, qos=1, encoding=None
+        )
     )
 
 
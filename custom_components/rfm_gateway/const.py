@@ -1,5 +1,7 @@
 """RFM Gateway constants."""
 
+from datetime import timedelta
+
 DOMAIN = "rfm_gateway"
 STORE = "store"
 CONF_GATEWAYS = "gateways"
@@ -8,3 +10,9 @@ GW_NAME = "RFM Gateway"
 MACUFACTURER = "Just Testing"
 
 NODE_TOPIC = "rfm_gateway/+/node/+"
+BACKLOG_TOPIC = "rfm_gateway/+/backlog"
+
+# Older backlog records come from a gateway with an unsynced clock.
+BACKLOG_MAX_AGE = timedelta(days=30)
+# Backlog readings kept for a sensor until it is added.
+BACKLOG_PENDING_LIMIT = 1000
@@ -1,7 +1,19 @@
 """Parse data and retrieve sensors values."""
 
+from collections.abc import Callable
+from datetime import datetime
+from functools import cache
+import struct
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.util import dt as dt_util
+
+from .const import BACKLOG_MAX_AGE
+
+# Every backlog record is a gateway timestamp (unix seconds), the frame length
+# and the frame itself, exactly as it is published to the node topic.
+BACKLOG_RECORD_HEADER = struct.Struct("<IB")
 
 
 def get_value(data: bytes, divisor: float = 0, num_digits: int = 0) -> str:
@@ -72,16 +84,52 @@ BINARY_SENSOR_PARSERS = {
     },
 }
 
+# Shortest frame that holds every value the parsers read for the node type.
+NODE_FRAME_LENGTHS = {
+    1: 7,
+    2: 9,
+    3: 11,
+    4: 13,
+    11: 11,
+    12: 11,
+    21: 8,
+}
+
+
+@cache
+def get_sensor_decode_plan(
+    node_type: int,
+) -> dict[SensorDeviceClass, Callable[[bytes], str]]:
+    """Return sensor parsers for the node type, built on first use of the type."""
+
+    return {
+        device_class: parsers[node_type]
+        for device_class, parsers in SENSOR_PARSERS.items()
+        if node_type in parsers
+    }
+
+
+@cache
+def get_binary_sensor_decode_plan(
+    node_type: int,
+) -> dict[BinarySensorDeviceClass, Callable[[bytes], bool]]:
+    """Return binary sensor parsers for the node type, built on first use."""
+
+    return {
+        device_class: parsers[node_type]
+        for device_class, parsers in BINARY_SENSOR_PARSERS.items()
+        if node_type in parsers
+    }
+
 
 def get_sensor_value(data: bytes, device_class: SensorDeviceClass | None) -> str | None:
     """Retrieve sensor value based on device_class and node type."""
 
-    node_type = data[4]
-
-    if not device_class or node_type not in SENSOR_PARSERS[device_class]:
+    parser = get_sensor_decode_plan(data[4]).get(device_class)
+    if parser is None or not is_frame_complete(data):
         return None
 
-    return SENSOR_PARSERS[device_class][node_type](data)
+    return parser(data)
 
 
 def get_binary_sensor_value(
@@ -89,9 +137,41 @@ def get_binary_sensor_value(
 ) -> bool | None:
     """Retrieve binary sensor value based on device_class and node type."""
 
-    node_type = data[4]
-
-    if not device_class or node_type not in BINARY_SENSOR_PARSERS[device_class]:
+    parser = get_binary_sensor_decode_plan(data[4]).get(device_class)
+    if parser is None or not is_frame_complete(data):
         return None
 
-    return BINARY_SENSOR_PARSERS[device_class][node_type](data)
+    return parser(data)
+
+
+def is_frame_complete(data: bytes) -> bool:
+    """Check the frame is long enough for all values of its node type."""
+
+    return len(data) >= 5 and len(data) >= NODE_FRAME_LENGTHS.get(data[4], 5)
+
+
+def parse_backlog(payload: bytes) -> list[tuple[datetime, bytes]]:
+    """Split a backlog payload into timestamped frames, oldest first."""
+
+    frames: list[tuple[datetime, bytes]] = []
+    now = dt_util.utcnow()
+    offset = 0
+    while offset + BACKLOG_RECORD_HEADER.size <= len(payload):
+        timestamp, length = BACKLOG_RECORD_HEADER.unpack_from(payload, offset)
+        offset += BACKLOG_RECORD_HEADER.size
+        frame = payload[offset : offset + length]
+        offset += length
+
+        # A truncated frame would decode missing bytes as zero, skip it.
+        if len(frame) < length or not is_frame_complete(frame):
+            continue
+
+        frame_time = dt_util.utc_from_timestamp(timestamp)
+        if frame_time < now - BACKLOG_MAX_AGE:
+            continue
+
+        # A gateway clock running ahead must not date readings in the future.
+        frames.append((min(frame_time, now), frame))
+
+    frames.sort(key=lambda item: item[0])
+    return frames
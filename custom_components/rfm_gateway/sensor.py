@@ -1,6 +1,7 @@
 """Support for RFM Gateway sensors."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
 from homeassistant.components import mqtt
@@ -22,10 +23,16 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import slugify
-
-from .const import CONF_GATEWAYS, DOMAIN, NODE_TOPIC
-from .data_parser import get_sensor_value
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    BACKLOG_PENDING_LIMIT,
+    BACKLOG_TOPIC,
+    CONF_GATEWAYS,
+    DOMAIN,
+    NODE_TOPIC,
+)
+from .data_parser import get_sensor_value, parse_backlog
 from .device import compose_gateway_device, compose_node_device
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,6 +48,8 @@ class NodeSensor(SensorEntity):
     TYPE = DOMAIN
     entity_description: NodeSensorEntityDescription
     node_type = 0
+    updated_at: datetime | None = None
+    _added = False
     _attr_should_poll = False
     _attr_has_entity_name = True
 
@@ -58,6 +67,39 @@ class NodeSensor(SensorEntity):
         self._attr_device_info = device_info
         self.node_type = node_type
         self.entity_description: NodeSensorEntityDescription = entity_description
+        self._backlog: list[tuple[datetime, float]] = []
+
+    async def async_added_to_hass(self) -> None:
+        """Import backlog readings received before the sensor was added."""
+        self._added = True
+        if self._backlog:
+            self.async_import_backlog(self._backlog)
+            self._backlog = []
+
+    @callback
+    def async_import_backlog(self, readings: list[tuple[datetime, float]]) -> None:
+        """Import backlog readings as statistics."""
+
+        if "recorder" not in self.hass.config.components:
+            return
+
+        # The state unit of the sensor is known only once it is added. A
+        # disabled sensor is never added, keep only its newest readings.
+        if not self._added:
+            self._backlog = sorted(self._backlog + readings)[-BACKLOG_PENDING_LIMIT:]
+            return
+
+        # Imported on use, the recorder is already loaded by then and
+        # platform setup does not pay for importing it.
+        from .backlog import (  # pylint: disable=import-outside-toplevel
+            async_import_backlog_statistics,
+        )
+
+        self.platform.config_entry.async_create_background_task(
+            self.hass,
+            async_import_backlog_statistics(self.hass, self, readings),
+            f"{DOMAIN} backlog import {self.entity_id}",
+        )
 
     def async_update_value(self, data: bytes):
         """Update the sensor value."""
@@ -180,6 +222,36 @@ async def async_setup_entry(
             config["mac"].lower(), config["name"]
         )
 
+    @callback
+    def async_process_sensor(
+        sensor: NodeSensor, data: bytes, timestamp: datetime
+    ) -> NodeSensor:
+        unique_id = sensor.unique_id.replace(":", "_")
+        if unique_id not in store:
+            sensor.hass = hass
+            sensor.updated_at = timestamp
+            sensor.async_update_value(data)
+            store[unique_id] = sensor
+            _LOGGER.debug(
+                "Registering sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+            async_add_entities((sensor,), True)
+        elif timestamp <= store[unique_id].updated_at:
+            _LOGGER.debug(
+                "Skipping outdated value of sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+        else:
+            _LOGGER.debug(
+                "Updating sensor %(name)s => %(unique_id)s",
+                {"name": sensor.name, "unique_id": sensor.unique_id},
+            )
+            store[unique_id].updated_at = timestamp
+            store[unique_id].async_update_value(data)
+
+        return store[unique_id]
+
     @callback
     def async_sensor_event_received(msg):
         gateway_id = msg.topic.split("/")[1].replace("_", ":").lower()
@@ -195,25 +267,56 @@ async def async_setup_entry(
 
         sensors = compose_node_entities(gateway_id, data)
         for sensor in sensors:
-            unique_id = sensor.unique_id.replace(":", "_")
-            if unique_id not in store:
-                sensor.hass = hass
-                sensor.async_update_value(data)
-                store[unique_id] = sensor
-                _LOGGER.debug(
-                    "Registering sensor %(name)s => %(unique_id)s",
-                    {"name": sensor.name, "unique_id": sensor.unique_id},
-                )
-                async_add_entities((sensor,), True)
-            else:
-                _LOGGER.debug(
-                    "Updating sensor %(name)s => %(unique_id)s",
-                    {"name": sensor.name, "unique_id": sensor.unique_id},
+            async_process_sensor(sensor, data, dt_util.utcnow())
+
+    @callback
+    def async_backlog_received(msg):
+        gateway_id = msg.topic.split("/")[1].replace("_", ":").lower()
+        gateway = gateways.get(gateway_id)
+
+        if not gateway:
+            _LOGGER.debug(
+                "No gateway with MAC %(gateway_id)s",
+                {"gateway_id": gateway_id},
+            )
+            return
+
+        # Only the newest frame goes to the state machine, older readings are
+        # imported as statistics with their gateway timestamps.
+        latest: dict[str, tuple[NodeSensor, bytes, datetime]] = {}
+        readings: dict[str, list[tuple[datetime, float]]] = {}
+        for timestamp, data in parse_backlog(bytes(msg.payload)):
+            for sensor in compose_node_entities(gateway_id, data):
+                value = get_sensor_value(data, sensor.entity_description.device_class)
+                if not value:
+                    continue
+
+                latest[sensor.unique_id] = (sensor, data, timestamp)
+                readings.setdefault(sensor.unique_id, []).append(
+                    (timestamp, float(value))
                 )
-                store[unique_id].async_update_value(data)
 
-    await mqtt.async_subscribe(
-        hass, NODE_TOPIC, async_sensor_event_received, qos=0, encoding=None
+        _LOGGER.debug(
+            "Received backlog of %(count)s sensor readings from %(gateway_id)s",
+            {
+                "count": sum(len(values) for values in readings.values()),
+                "gateway_id": gateway_id,
+            },
+        )
+        for unique_id, (sensor, data, timestamp) in latest.items():
+            sensor = async_process_sensor(sensor, data, timestamp)
+            sensor.async_import_backlog(readings[unique_id])
+
+    entry.async_on_unload(store.clear)
+    entry.async_on_unload(
+        await mqtt.async_subscribe(
+            hass, NODE_TOPIC, async_sensor_event_received, qos=0, encoding=None
+        )
+    )
+    entry.async_on_unload(
+        await mqtt.async_subscribe(
+            hass, BACKLOG_TOPIC, async_backlog_received, qos=1, encoding=None
+        )
     )
 
 
@@ -0,0 +1,69 @@
+"""Tests for the RFM Gateway integration."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.rfm_gateway.const import CONF_GATEWAYS, DOMAIN, STORE
+from custom_components.rfm_gateway.data_parser import BACKLOG_RECORD_HEADER
+from homeassistant.components.recorder import get_instance
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+GATEWAY_ID = "aa:bb:cc:dd:ee:ff"
+NODE_TOPIC = f"{DOMAIN}/aa_bb_cc_dd_ee_ff/node"
+BACKLOG_TOPIC = f"{DOMAIN}/aa_bb_cc_dd_ee_ff/backlog"
+
+
+def compose_meter_frame(node_id: int, node_type: int, reading: float) -> bytes:
+    """Compose a gas (11) or water (12) meter frame."""
+
+    return (
+        node_id.to_bytes(2, "little")
+        + (-60).to_bytes(2, "little", signed=True)
+        + bytes([node_type])
+        + round(reading * 100).to_bytes(4, "little")
+        + (3300).to_bytes(2, "little")
+    )
+
+
+def compose_backlog(*records: tuple[datetime, bytes]) -> bytes:
+    """Compose a backlog payload from timestamped frames."""
+
+    return b"".join(
+        BACKLOG_RECORD_HEADER.pack(int(timestamp.timestamp()), len(frame)) + frame
+        for timestamp, frame in records
+    )
+
+
+async def async_setup_gateway(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a single gateway."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_GATEWAYS: [{"mac": GATEWAY_ID, "name": "RFM Gateway"}], STORE: {}},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def async_wait_for_imports(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Wait until backlog statistics are imported."""
+
+    await hass.async_block_till_done()
+    # pylint: disable-next=protected-access
+    while tasks := list(entry._background_tasks):
+        await asyncio.gather(*tasks)
+        await hass.async_block_till_done()
+    await get_instance(hass).async_block_till_done()
+
+
+def get_entity_id(hass: HomeAssistant, node_id: int, key: str) -> str | None:
+    """Return the entity_id of the node sensor."""
+
+    unique_id = f"{GATEWAY_ID}_{node_id}_{key}"
+    return er.async_get(hass).async_get_entity_id("sensor", DOMAIN, unique_id)
@@ -0,0 +1,5 @@
+"""Fixtures for RFM Gateway tests."""
+
+# Import the integration before Home Assistant mounts its test config dir, so
+# custom_components resolves to this repository.
+from custom_components.rfm_gateway.const import DOMAIN  # noqa: F401
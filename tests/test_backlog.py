@@ -0,0 +1,239 @@
+"""Tests for the RFM Gateway backlog statistics import."""
+from datetime import datetime, timedelta
+from functools import partial
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_mqtt_message
+
+from custom_components.rfm_gateway.backlog import (
+    compose_measurement_statistics,
+    compose_total_statistics,
+    get_hour_start,
+)
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.statistics import (
+    get_metadata,
+    statistics_during_period,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
+
+from . import (
+    BACKLOG_TOPIC,
+    NODE_TOPIC,
+    async_setup_gateway,
+    async_wait_for_imports,
+    compose_backlog,
+    compose_meter_frame,
+    get_entity_id,
+)
+
+START = datetime(2026, 10, 19, 0, 0, tzinfo=dt_util.UTC)
+HOUR = timedelta(hours=1)
+
+
+def get_rows(statistics: list) -> list[tuple]:
+    """Return start, state and sum of the composed statistics."""
+
+    return [(row["start"], row["state"], row["sum"]) for row in statistics]
+
+
+def test_total_statistics_gap_hours() -> None:
+    """Test hours without readings carry the state and sum up to the end."""
+
+    readings = [(START + timedelta(minutes=10), 10.0), (START + 2 * HOUR, 12.0)]
+
+    statistics = compose_total_statistics(readings, None, START + 4 * HOUR)
+
+    assert get_rows(statistics) == [
+        (START, 10.0, 0.0),
+        (START + HOUR, 10.0, 0.0),
+        (START + 2 * HOUR, 12.0, 2.0),
+        (START + 3 * HOUR, 12.0, 2.0),
+    ]
+
+
+def test_total_statistics_continue_last() -> None:
+    """Test the sum continues from the last recorded statistic."""
+
+    readings = [(START, 11.0), (START + HOUR, 13.0)]
+
+    statistics = compose_total_statistics(
+        readings, {"state": 10.0, "sum": 5.0}, START + 2 * HOUR
+    )
+
+    assert get_rows(statistics) == [(START, 11.0, 6.0), (START + HOUR, 13.0, 8.0)]
+
+
+def test_total_statistics_reset_and_dip() -> None:
+    """Test only a drop of more than 10% is a meter reset."""
+
+    readings = [
+        (START, 100.0),
+        (START + timedelta(minutes=10), 95.0),
+        (START + timedelta(minutes=20), 101.0),
+        (START + timedelta(minutes=30), 2.0),
+        (START + timedelta(minutes=40), 3.0),
+    ]
+
+    statistics = compose_total_statistics(readings, None, START + HOUR)
+
+    assert get_rows(statistics) == [(START, 3.0, 4.0)]
+
+
+def test_measurement_statistics() -> None:
+    """Test only covered hours are composed with a time weighted mean."""
+
+    readings = [
+        (START + timedelta(minutes=30), 10.0),
+        (START + HOUR + timedelta(minutes=15), 20.0),
+        (START + 2 * HOUR + timedelta(minutes=45), 30.0),
+        (START + 3 * HOUR + timedelta(minutes=30), 40.0),
+    ]
+
+    statistics = compose_measurement_statistics(readings, START + 4 * HOUR)
+
+    assert [
+        (row["start"], row["mean"], row["min"], row["max"]) for row in statistics
+    ] == [
+        (START + HOUR, 17.5, 10.0, 20.0),
+        (START + 2 * HOUR, 22.5, 20.0, 30.0),
+    ]
+
+
+async def async_get_statistics(
+    hass: HomeAssistant, statistic_id: str, start: datetime
+) -> list[tuple]:
+    """Return start, state and sum of recorded statistics."""
+
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start,
+        None,
+        {statistic_id},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    return [
+        (dt_util.utc_from_timestamp(row["start"]), row["state"], row["sum"])
+        for row in rows.get(statistic_id, [])
+    ]
+
+
+async def test_backlog_batches(
+    recorder_mock, enable_custom_integrations, hass: HomeAssistant, mqtt_mock
+) -> None:
+    """Test consecutive batches continue the sum and fill gap hours."""
+
+    entry = await async_setup_gateway(hass)
+    current_hour = get_hour_start(dt_util.utcnow())
+    first = current_hour - 6 * HOUR
+
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog((first, compose_meter_frame(7, 12, 10.0))),
+    )
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog(
+            (first + 2 * HOUR, compose_meter_frame(7, 12, 11.0)),
+            (first + 3 * HOUR, compose_meter_frame(7, 12, 13.0)),
+        ),
+    )
+    await async_wait_for_imports(hass, entry)
+
+    entity_id = get_entity_id(hass, 7, "water consumption")
+    assert hass.states.get(entity_id).state == "13.00"
+    assert await async_get_statistics(hass, entity_id, first) == [
+        (first, 10.0, 0.0),
+        (first + HOUR, 10.0, 0.0),
+        (first + 2 * HOUR, 11.0, 1.0),
+        (first + 3 * HOUR, 13.0, 3.0),
+        (first + 4 * HOUR, 13.0, 3.0),
+        (first + 5 * HOUR, 13.0, 3.0),
+    ]
+
+
+async def test_backlog_unit_conversion(
+    recorder_mock, enable_custom_integrations, hass: HomeAssistant, mqtt_mock
+) -> None:
+    """Test readings are imported in the state unit of the sensor."""
+
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    entry = await async_setup_gateway(hass)
+    first = get_hour_start(dt_util.utcnow()) - 2 * HOUR
+
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog(
+            (first, compose_meter_frame(7, 11, 1.0)),
+            (first + HOUR, compose_meter_frame(7, 11, 2.0)),
+        ),
+    )
+    await async_wait_for_imports(hass, entry)
+
+    entity_id = get_entity_id(hass, 7, "gas consumption")
+    metadata = await get_instance(hass).async_add_executor_job(
+        partial(get_metadata, hass, statistic_ids={entity_id})
+    )
+    assert metadata[entity_id][1]["unit_of_measurement"] == "ft³"
+    rows = await async_get_statistics(hass, entity_id, first)
+    assert rows[-1][1] == pytest.approx(70.6293, abs=1e-4)
+    assert rows[-1][2] == pytest.approx(35.3147, abs=1e-4)
+
+
+async def test_backlog_older_than_live(
+    recorder_mock, enable_custom_integrations, hass: HomeAssistant, mqtt_mock
+) -> None:
+    """Test a live value is not replaced by an older backlog frame."""
+
+    entry = await async_setup_gateway(hass)
+    async_fire_mqtt_message(hass, f"{NODE_TOPIC}/7", compose_meter_frame(7, 12, 20.0))
+    await hass.async_block_till_done()
+
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog(
+            (dt_util.utcnow() - timedelta(minutes=5), compose_meter_frame(7, 12, 15.0))
+        ),
+    )
+    await async_wait_for_imports(hass, entry)
+
+    entity_id = get_entity_id(hass, 7, "water consumption")
+    assert hass.states.get(entity_id).state == "20.00"
+
+
+async def test_backlog_before_added(
+    recorder_mock, enable_custom_integrations, hass: HomeAssistant, mqtt_mock
+) -> None:
+    """Test batches received before the sensor is added are imported in order."""
+
+    entry = await async_setup_gateway(hass)
+    first = get_hour_start(dt_util.utcnow()) - 3 * HOUR
+
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog((first + HOUR, compose_meter_frame(7, 12, 12.0))),
+    )
+    async_fire_mqtt_message(
+        hass,
+        BACKLOG_TOPIC,
+        compose_backlog((first, compose_meter_frame(7, 12, 10.0))),
+    )
+    await async_wait_for_imports(hass, entry)
+
+    entity_id = get_entity_id(hass, 7, "water consumption")
+    assert hass.states.get(entity_id).state == "12.00"
+    assert await async_get_statistics(hass, entity_id, first) == [
+        (first, 10.0, 0.0),
+        (first + HOUR, 12.0, 2.0),
+        (first + 2 * HOUR, 12.0, 2.0),
+    ]
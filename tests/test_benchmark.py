@@ -0,0 +1,110 @@
+"""Benchmark RFM Gateway import time, setup time and node catalog handling.
+
+Timings are printed, run with `python -m pytest tests/test_benchmark.py -s`.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import async_fire_mqtt_message
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import SLOW_SETUP_WARNING
+
+from . import NODE_TOPIC, async_setup_gateway
+
+PACKAGE = "custom_components.rfm_gateway"
+MODULES = ["", ".data_parser", ".binary_sensor", ".sensor", ".backlog"]
+# Loaded by Home Assistant before the integration, not part of its import time.
+PRELOADED = [
+    "homeassistant.components.mqtt",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+]
+RECORDER = "homeassistant.components.recorder"
+NODE_TYPES = [1, 2, 3, 4, 11, 12, 21]
+NODES = 500
+
+
+def measure_import(module: str) -> tuple[float, bool]:
+    """Measure import time of the module in a fresh interpreter.
+
+    Also report whether importing it loaded the recorder.
+    """
+
+    code = (
+        "import sys, time\n"
+        + "".join(f"import {name}\n" for name in PRELOADED)
+        + "started = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - started)\n"
+        f"print({RECORDER!r} in sys.modules)\n"
+    )
+    elapsed, recorder = subprocess.check_output(
+        [sys.executable, "-c", code], text=True
+    ).split()
+    return float(elapsed), recorder == "True"
+
+
+def compose_frame(node_id: int, node_type: int) -> bytes:
+    """Compose a node frame large enough for any node type."""
+
+    return node_id.to_bytes(2, "little") + b"\xc4\xff" + bytes([node_type]) + bytes(16)
+
+
+def test_import_time() -> None:
+    """Test the platforms do not import the recorder."""
+
+    print()
+    for module in MODULES:
+        elapsed, recorder = measure_import(f"{PACKAGE}{module}")
+        print(f"import {PACKAGE}{module}: {elapsed * 1000:.2f} ms")
+        assert recorder == (module == ".backlog")
+
+
+async def test_setup_entry_time(
+    enable_custom_integrations,
+    hass: HomeAssistant,
+    mqtt_client_mock: MagicMock,
+    mqtt_mock,
+) -> None:
+    """Test setup is fast and does not wait for the broker to acknowledge."""
+
+    # The broker never acknowledges, setup must not wait for it.
+    mqtt_client_mock.subscribe.side_effect = lambda topic, qos=0: (0, 1000)
+
+    started = time.perf_counter()
+    entry = await async_setup_gateway(hass)
+    elapsed = time.perf_counter() - started
+
+    print(f"\nasync_setup_entry: {elapsed * 1000:.2f} ms")
+    assert elapsed < SLOW_SETUP_WARNING
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_node_catalog(
+    enable_custom_integrations, hass: HomeAssistant, mqtt_mock
+) -> None:
+    """Test handling of the first and the next frame of every node."""
+
+    entry = await async_setup_gateway(hass)
+    frames = [
+        (f"{NODE_TOPIC}/{node_id}", compose_frame(node_id, NODE_TYPES[node_id % 7]))
+        for node_id in range(NODES)
+    ]
+
+    for run in ("first use", "warm"):
+        started = time.perf_counter()
+        for topic, data in frames:
+            async_fire_mqtt_message(hass, topic, data)
+        await hass.async_block_till_done()
+        elapsed = time.perf_counter() - started
+
+        print(f"\n{NODES} nodes, {run}: {elapsed * 1000:.2f} ms")
+        assert elapsed < SLOW_SETUP_WARNING
+
+    assert len(hass.states.async_entity_ids()) >= NODES * 2
+    assert await hass.config_entries.async_unload(entry.entry_id)
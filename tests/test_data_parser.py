@@ -0,0 +1,71 @@
+"""Tests for the RFM Gateway data parser."""
+from datetime import timedelta
+
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.util import dt as dt_util
+
+from custom_components.rfm_gateway.data_parser import get_sensor_value, parse_backlog
+
+from . import compose_backlog, compose_meter_frame
+
+
+def test_get_sensor_value() -> None:
+    """Test meter frames are decoded."""
+
+    frame = compose_meter_frame(5, 11, 123.45)
+
+    assert get_sensor_value(frame, SensorDeviceClass.GAS) == "123.45"
+    assert get_sensor_value(frame, SensorDeviceClass.VOLTAGE) == "3.30"
+    assert get_sensor_value(frame, SensorDeviceClass.SIGNAL_STRENGTH) == "-60"
+    assert get_sensor_value(frame, SensorDeviceClass.WATER) is None
+
+
+def test_get_sensor_value_short_frame() -> None:
+    """Test a frame missing bytes of its node type is not decoded as zero."""
+
+    frame = compose_meter_frame(5, 11, 123.45)[:8]
+
+    assert get_sensor_value(frame, SensorDeviceClass.GAS) is None
+    assert get_sensor_value(frame, SensorDeviceClass.SIGNAL_STRENGTH) is None
+
+
+def test_parse_backlog() -> None:
+    """Test backlog records are split and sorted oldest first."""
+
+    now = dt_util.utcnow().replace(microsecond=0)
+    older = compose_meter_frame(5, 11, 1.0)
+    newer = compose_meter_frame(5, 11, 2.0)
+    hour_ago, minutes_ago = now - timedelta(hours=1), now - timedelta(minutes=5)
+
+    frames = parse_backlog(compose_backlog((minutes_ago, newer), (hour_ago, older)))
+
+    assert frames == [(hour_ago, older), (minutes_ago, newer)]
+
+
+def test_parse_backlog_timestamps() -> None:
+    """Test unsynced timestamps are dropped and future ones clamped."""
+
+    now = dt_util.utcnow()
+    frame = compose_meter_frame(5, 11, 1.0)
+
+    frames = parse_backlog(
+        compose_backlog(
+            (dt_util.utc_from_timestamp(0), frame),
+            (now - timedelta(days=31), frame),
+            (now + timedelta(hours=1), frame),
+        )
+    )
+
+    assert len(frames) == 1
+    assert now <= frames[0][0] <= dt_util.utcnow()
+
+
+def test_parse_backlog_truncated() -> None:
+    """Test truncated records and frames too short for the node are skipped."""
+
+    now = dt_util.utcnow().replace(microsecond=0)
+    frame = compose_meter_frame(5, 11, 1.0)
+    payload = compose_backlog((now, frame[:8]), (now, frame))
+
+    assert parse_backlog(payload) == [(now, frame)]
+    assert parse_backlog(payload[:-1]) == []